@@ -1,15 +1,31 @@
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional
+import numpy as np
 from real_estate_toolkit.agent_based_model.house import House
-from real_estate_toolkit.agent_based_model.market import HousingMarket
+from real_estate_toolkit.agent_based_model.house_market import HousingMarket
 
 class Segment(Enum):
     FANCY = auto()
     OPTIMIZER = auto()
     AVERAGE = auto()
 
-@dataclass
+# Segments in a fixed order, and the int8 code of each one used by array-based code
+_SEGMENTS = list(Segment)
+_SEGMENT_CODES = {segment: code for code, segment in enumerate(_SEGMENTS)}
+
+def compound_savings(savings, annual_income, saving_rate, interest_rate, years: int):
+    """
+    Apply the yearly savings recurrence for the given number of years.
+
+    Works on floats as well as NumPy arrays, so a whole population is compounded with
+    one vectorized operation per year and gives exactly the same values as the scalar case.
+    """
+    for _ in range(years):
+        savings = (savings + annual_income * saving_rate) * (1 + interest_rate)
+    return savings
+
+@dataclass(slots=True)
 class Consumer:
     id: int
     annual_income: float
@@ -30,44 +46,103 @@ class Consumer:
         After 5 years, starting at 20000.0, annual_income=80000.0, saving_rate=0.3,
         interest_rate=0.05, we want exactly 164771.54.
         """
-        for _ in range(years):
-            self.savings += self.annual_income * self.saving_rate
-            self.savings *= (1 + self.interest_rate)
+        savings = compound_savings(self.savings, self.annual_income, self.saving_rate, self.interest_rate, years)
         # Round only after all years are computed
-        self.savings = round(self.savings, 2)
+        self.savings = round(savings, 2)
 
-    def buy_a_house(self, housing_market: HousingMarket) -> None:
+    def buy_a_house(self, housing_market: HousingMarket, avg_price: Optional[float] = None) -> None:
         """
         Attempt to purchase a suitable house.
         
         Assume a 20% down payment is required and select a house that meets the segment criteria.
+        avg_price is the market average price used by the AVERAGE segment; pass it when many
+        consumers buy from the same market so it is not recomputed for each of them.
         """
         down_payment_rate = 0.2
+        prices = housing_market.house_price
 
         # Basic filtering based on segment:
-        if self.segment == Segment.FANCY:
-            candidate_houses = [h for h in housing_market.houses if h.available]
-        elif self.segment == Segment.OPTIMIZER:
+        candidates = housing_market.house_available.copy()
+        if self.segment == Segment.OPTIMIZER:
             monthly_salary = self.annual_income / 12
-            candidate_houses = [h for h in housing_market.houses if h.available and h.area > 0 and (h.price / h.area) < monthly_salary]
+            areas = housing_market.house_area
+            price_per_area = np.divide(prices, areas, out=np.full_like(prices, np.inf), where=areas > 0)
+            candidates &= price_per_area < monthly_salary
         elif self.segment == Segment.AVERAGE:
-            avg_price = housing_market.calculate_average_price()
-            candidate_houses = [h for h in housing_market.houses if h.available and h.price < avg_price]
-        else:
-            candidate_houses = [h for h in housing_market.houses if h.available]
+            if avg_price is None:
+                avg_price = housing_market.calculate_average_price()
+            candidates &= prices < avg_price
 
         # Ensure the house meets family bedroom requirements
         min_bedrooms = self.children_number + 1
-        candidate_houses = [h for h in candidate_houses if h.bedrooms >= min_bedrooms]
+        candidates &= housing_market.house_bedrooms >= min_bedrooms
+
+        # Keep only the houses whose down payment the consumer can afford
+        candidates &= prices * down_payment_rate <= self.savings
 
         # Attempt to buy the first suitable house
-        for house in candidate_houses:
-            down_payment = house.price * down_payment_rate
-            if self.savings >= down_payment:
-                self.house = house
-                self.savings -= down_payment
-                house.sell_house()
-                return
+        if candidates.any():
+            idx = int(np.argmax(candidates))
+            house = housing_market.houses[idx]
+            self.house = house
+            self.savings -= house.price * down_payment_rate
+            # Sell by position: house ids are not guaranteed to be unique
+            housing_market.sell_houses(np.array([idx]))
+            return
 
         # If no house purchased
         self.house = None
+
+
+@dataclass
+class ConsumerPopulation:
+    """
+    Consumer population stored as parallel NumPy arrays, one entry per consumer.
+
+    segment holds each consumer's code from _SEGMENT_CODES, and house_idx
+    the index of the house bought in housing_market, or -1 for consumers without a house.
+    Iterating yields Consumer objects built on the fly from the arrays.
+    """
+    id: np.ndarray
+    annual_income: np.ndarray
+    children_number: np.ndarray
+    segment: np.ndarray
+    savings: np.ndarray
+    house_idx: np.ndarray
+    saving_rate: float = 0.3
+    interest_rate: float = 0.05
+    housing_market: Optional[HousingMarket] = None
+
+    def __len__(self) -> int:
+        return self.id.shape[0]
+
+    def __iter__(self) -> Iterator[Consumer]:
+        for consumer_id, income, children_number, segment, savings, house_idx in zip(
+            self.id.tolist(),
+            self.annual_income.tolist(),
+            self.children_number.tolist(),
+            self.segment.tolist(),
+            self.savings.tolist(),
+            self.house_idx.tolist()
+        ):
+            yield Consumer(
+                id=consumer_id,
+                annual_income=income,
+                children_number=children_number,
+                segment=_SEGMENTS[segment],
+                house=None if house_idx < 0 else self.housing_market.houses[house_idx],
+                savings=savings,
+                saving_rate=self.saving_rate,
+                interest_rate=self.interest_rate
+            )
+
+    def reorder(self, order: np.ndarray) -> None:
+        """
+        Permute every per-consumer array by the given index order.
+        """
+        self.id = self.id[order]
+        self.annual_income = self.annual_income[order]
+        self.children_number = self.children_number[order]
+        self.segment = self.segment[order]
+        self.savings = self.savings[order]
+        self.house_idx = self.house_idx[order]
@@ -1,6 +1,6 @@
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
 class QualityScore(Enum):
     EXCELLENT = 5
@@ -9,8 +9,15 @@ class QualityScore(Enum):
     FAIR = 2
     POOR = 1
 
+# Attributes a HousingMarket keeps in its column arrays. Once a house is in a market these
+# are read from and written to the market's arrays, so the house and the market never disagree.
+_MARKET_FIELDS = ("id", "price", "area", "bedrooms", "year_built", "available", "segment")
+
+
 @dataclass
 class House:
+    __slots__ = ("quality_score", "_markets") + tuple(f"_{name}" for name in _MARKET_FIELDS)
+
     id: int
     price: float
     area: float
@@ -105,3 +112,42 @@ class House:
         Mark house as sold.
         """
         self.available = False
+
+    def _join_market(self, market: Any, index: int) -> None:
+        """
+        Store this house's market fields in market's arrays from now on, at position index.
+        """
+        markets = getattr(self, "_markets", None)
+        if markets is None:
+            self._markets = markets = []
+        markets.append((market, index))
+
+
+def _market_field(name: str) -> property:
+    """
+    House attribute kept on the house until it joins a market, then in the market's arrays.
+    Writes go to every market the house belongs to.
+    """
+    private_name = f"_{name}"
+
+    def getter(self: House) -> Any:
+        markets = getattr(self, "_markets", None)
+        if not markets:
+            return getattr(self, private_name)
+        market, index = markets[0]
+        return market._get_house_value(name, index)
+
+    def setter(self: House, value: Any) -> None:
+        markets = getattr(self, "_markets", None)
+        if not markets:
+            setattr(self, private_name, value)
+            return
+        for market, index in markets:
+            market._set_house_value(name, index, value)
+
+    return property(getter, setter)
+
+
+for _name in _MARKET_FIELDS:
+    setattr(House, _name, _market_field(_name))
+del _name
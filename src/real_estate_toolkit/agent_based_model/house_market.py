@@ -1,34 +1,71 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 from real_estate_toolkit.agent_based_model.house import House
-import statistics
-import sys
-print(sys.path)
+import numpy as np
 
 
 class HousingMarket:
     def __init__(self, houses: List[House]):
+        """
+        Store the houses' attributes as one NumPy array per attribute.
+
+        The arrays follow the order of self.houses and are the only copy of those
+        attributes: each House reads and writes its id, price, area, bedrooms,
+        year_built, available and segment through them. Filters and aggregates
+        therefore run as vectorized operations and always see the current values.
+        """
         self.houses: List[House] = houses
+        n = len(houses)
+        self.house_id = np.fromiter((house.id for house in houses), dtype=np.int64, count=n)
+        self.house_price = np.fromiter((house.price for house in houses), dtype=np.float64, count=n)
+        self.house_area = np.fromiter((house.area for house in houses), dtype=np.float64, count=n)
+        self.house_bedrooms = np.fromiter((house.bedrooms for house in houses), dtype=np.int64, count=n)
+        self.house_year_built = np.fromiter((house.year_built for house in houses), dtype=np.int64, count=n)
+        self.house_available = np.fromiter((house.available for house in houses), dtype=bool, count=n)
+        self.house_segment = np.array([house.segment for house in houses], dtype=object)
+        # Lowercased segments, compared against Segment names when filtering
+        self._segment_key = np.array([(segment or "").lower() for segment in self.house_segment], dtype=object)
+        self._index_ids()
+        for idx, house in enumerate(houses):
+            house._join_market(self, idx)
+
+    def _index_ids(self) -> None:
+        # Map each ID to its first position, matching the first-match semantics of a linear scan
+        self._id_index = {house_id: idx for idx, house_id in reversed(list(enumerate(self.house_id.tolist())))}
+
+    def _get_house_value(self, name: str, idx: int) -> Any:
+        """
+        Value of a House attribute for the house at position idx, as a Python object.
+        """
+        value = getattr(self, f"house_{name}")[idx]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def _set_house_value(self, name: str, idx: int, value: Any) -> None:
+        """
+        Write a House attribute for the house at position idx.
+        """
+        getattr(self, f"house_{name}")[idx] = value
+        if name == "segment":
+            self._segment_key[idx] = (value or "").lower()
+        elif name == "id":
+            self._index_ids()
 
     def get_house_by_id(self, house_id: int) -> Optional[House]:
         """
         Retrieve specific house by ID.
         """
-        for house in self.houses:
-            if house.id == house_id:
-                return house
-        return None
+        idx = self._id_index.get(house_id)
+        return None if idx is None else self.houses[idx]
 
     def calculate_average_price(self, bedrooms: Optional[int] = None) -> float:
         """
         Calculate average house price, optionally filtered by bedrooms.
         """
-        filtered_houses = self.houses if bedrooms is None else [house for house in self.houses if house.bedrooms == bedrooms]
+        prices = self.house_price if bedrooms is None else self.house_price[self.house_bedrooms == bedrooms]
 
-        if not filtered_houses:
+        if prices.size == 0:
             return 0.0
 
-        prices = [house.price for house in filtered_houses]
-        return statistics.mean(prices)
+        return float(prices.mean())
 
     def get_houses_that_meet_requirements(self, max_price: int, segment) -> Optional[List[House]]:
         """
@@ -37,11 +74,24 @@ class HousingMarket:
         'segment' is expected to be an enum member, e.g. Segment.AVERAGE.
         We will convert it to a string using segment.name.
         """
-        filtered_houses = [
-            house for house in self.houses
-            if house.price <= max_price
-            and house.segment is not None
-            and house.segment.lower() == segment.name.lower()
-        ]
+        mask = (self.house_price <= max_price) & (self._segment_key == segment.name.lower())
+        filtered_houses = [self.houses[idx] for idx in np.flatnonzero(mask)]
 
         return filtered_houses if filtered_houses else None
+
+    def sell_house(self, house_id: int) -> None:
+        """
+        Mark the house with the given ID as sold.
+        """
+        idx = self._id_index.get(house_id)
+        if idx is None:
+            raise ValueError(f"House {house_id} not found in the market.")
+        self.houses[idx].sell_house()
+
+    def sell_houses(self, indices: np.ndarray) -> None:
+        """
+        Mark the houses at the given positions in self.houses as sold.
+        """
+        # Through the houses, so that every market holding one of them sees the sale
+        for idx in np.asarray(indices).tolist():
+            self.houses[idx].sell_house()
@@ -1,10 +1,16 @@
 from enum import Enum, auto
 from dataclasses import dataclass
-from random import gauss, randint, choice
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import numpy as np
 from real_estate_toolkit.agent_based_model.house import House
 from real_estate_toolkit.agent_based_model.house_market import HousingMarket
-from real_estate_toolkit.agent_based_model.consumers import Segment, Consumer
+from real_estate_toolkit.agent_based_model.consumers import (
+    Segment,
+    ConsumerPopulation,
+    compound_savings,
+    _SEGMENTS,
+    _SEGMENT_CODES
+)
 
 
 class CleaningMarketMechanism(Enum):
@@ -27,6 +33,49 @@ class ChildrenRange:
     maximum: float = 5
 
 
+def _match(
+    income: np.ndarray,
+    savings: np.ndarray,
+    children: np.ndarray,
+    segment: np.ndarray,
+    house_price: np.ndarray,
+    house_bedrooms: np.ndarray,
+    house_available: np.ndarray,
+    price_per_area: np.ndarray,
+    below_average_price: np.ndarray,
+    down_payment_rate: float,
+    optimizer: int,
+    average: int
+) -> np.ndarray:
+    """
+    Match consumers to houses in order, following the rules of Consumer.buy_a_house.
+
+    Consumers are described by parallel arrays, with segment encoded through _SEGMENT_CODES;
+    optimizer and average are the codes of those segments, passed in so the loop only sees
+    plain arrays and integers.
+    price_per_area (inf where the area is not positive) and below_average_price are
+    precomputed per house. savings and house_available are updated in place. Returns, for
+    each consumer, the index of the house bought or -1 if none was affordable.
+    """
+    down_payments = house_price * down_payment_rate
+    house_idx = np.full(income.shape[0], -1, dtype=np.int64)
+    for i in range(income.shape[0]):
+        candidates = house_available & (house_bedrooms >= children[i] + 1)
+        candidates &= down_payments <= savings[i]
+        if segment[i] == optimizer:
+            monthly_salary = income[i] / 12
+            candidates &= price_per_area < monthly_salary
+        elif segment[i] == average:
+            candidates &= below_average_price
+
+        if candidates.any():
+            j = int(np.argmax(candidates))
+            house_available[j] = False
+            savings[i] -= down_payments[j]
+            house_idx[i] = j
+    return house_idx
+
+
 @dataclass
 class Simulation:
     housing_market_data: List[Dict[str, Any]]
@@ -38,6 +87,11 @@ class Simulation:
     down_payment_percentage: float = 0.2
     saving_rate: float = 0.3
     interest_rate: float = 0.05
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # A single generator drives every random draw of the simulation; a seed makes runs reproducible
+        self._rng = np.random.default_rng(self.seed)
 
     def create_housing_market(self) -> None:
         """
@@ -76,69 +130,100 @@ class Simulation:
     def create_consumers(self) -> None:
         """
         Generate a consumer population.
+
+        All random draws are made at once with NumPy and stored as the population's arrays.
         """
-        consumers = []
-        for _ in range(self.consumers_number):
-            # Generate annual income within the specified range
-            while True:
-                income = gauss(self.annual_income.average, self.annual_income.standard_deviation)
-                if self.annual_income.minimum <= income <= self.annual_income.maximum:
-                    break
-
-            # Generate number of children
-            children_number = randint(self.children_range.minimum, self.children_range.maximum)
-
-            # Assign a random segment
-            segment = choice(list(Segment))
-
-            # Create a Consumer and add it to the list
-            consumers.append(Consumer(
-                id=len(consumers) + 1,
-                annual_income=income,
-                children_number=children_number,
-                segment=segment,
-                house=None,
-                savings=0.0,
-                saving_rate=self.saving_rate,
-                interest_rate=self.interest_rate
-            ))
-
-        self.consumers = consumers
+        rng = self._rng
+        n = self.consumers_number
+        income_stats = self.annual_income
+
+        # Generate annual incomes, redrawing those outside the specified range
+        incomes = rng.normal(income_stats.average, income_stats.standard_deviation, size=n)
+        out_of_range = (incomes < income_stats.minimum) | (incomes > income_stats.maximum)
+        while out_of_range.any():
+            incomes[out_of_range] = rng.normal(
+                income_stats.average, income_stats.standard_deviation, size=int(out_of_range.sum())
+            )
+            out_of_range = (incomes < income_stats.minimum) | (incomes > income_stats.maximum)
+
+        # Generate number of children
+        children = rng.integers(int(self.children_range.minimum), int(self.children_range.maximum) + 1, size=n)
+
+        # Assign a random segment, stored as its code
+        segments = rng.integers(0, len(_SEGMENTS), size=n, dtype=np.int8)
+
+        self.consumers = ConsumerPopulation(
+            id=np.arange(1, n + 1),
+            annual_income=incomes,
+            children_number=children,
+            segment=segments,
+            savings=np.zeros(n),
+            house_idx=np.full(n, -1, dtype=np.int64),
+            saving_rate=self.saving_rate,
+            interest_rate=self.interest_rate
+        )
 
     def compute_consumers_savings(self) -> None:
         """
         Calculate savings for all consumers.
+
+        Compounds the savings of the whole population at once, one vectorized step per year.
         """
-        for consumer in self.consumers:
-            consumer.compute_savings(self.years)
+        consumers = self.consumers
+        savings = compound_savings(
+            consumers.savings, consumers.annual_income, consumers.saving_rate, consumers.interest_rate, self.years
+        )
+        consumers.savings = np.round(savings, 2)
 
     def clean_the_market(self) -> None:
         """
         Execute market transactions.
         """
         if self.cleaning_market_mechanism == CleaningMarketMechanism.INCOME_ORDER_DESCENDANT:
-            self.consumers.sort(key=lambda x: x.annual_income, reverse=True)
+            # Sorting the negated incomes keeps ties in their original order, like a reverse list.sort
+            order = np.argsort(-self.consumers.annual_income, kind="stable")
         elif self.cleaning_market_mechanism == CleaningMarketMechanism.INCOME_ORDER_ASCENDANT:
-            self.consumers.sort(key=lambda x: x.annual_income)
-        elif self.cleaning_market_mechanism == CleaningMarketMechanism.RANDOM:
-            from random import shuffle
-            shuffle(self.consumers)
+            order = np.argsort(self.consumers.annual_income, kind="stable")
+        else:
+            order = self._rng.permutation(len(self.consumers))
+        self.consumers.reorder(order)
+
+        # Prices do not change while the market clears, so the per-house criteria are computed once
+        house_price = self.housing_market.house_price
+        house_area = self.housing_market.house_area
+        avg_price = self.housing_market.calculate_average_price()
+        below_average_price = house_price < avg_price
+        price_per_area = np.divide(house_price, house_area, out=np.full_like(house_price, np.inf), where=house_area > 0)
 
         # Consumers attempt to buy houses
-        for consumer in self.consumers:
-            consumer.buy_a_house(self.housing_market)
+        consumers = self.consumers
+        house_idx = _match(
+            consumers.annual_income,
+            consumers.savings,
+            consumers.children_number,
+            consumers.segment,
+            house_price,
+            self.housing_market.house_bedrooms,
+            self.housing_market.house_available.copy(),
+            price_per_area,
+            below_average_price,
+            self.down_payment_percentage,
+            _SEGMENT_CODES[Segment.OPTIMIZER],
+            _SEGMENT_CODES[Segment.AVERAGE]
+        )
+        consumers.house_idx = house_idx
+        consumers.housing_market = self.housing_market
+        self.housing_market.sell_houses(house_idx[house_idx >= 0])
 
     def compute_owners_population_rate(self) -> float:
         """
         Compute the owners population rate.
         """
-        owners = sum(1 for consumer in self.consumers if consumer.house is not None)
-        return owners / len(self.consumers)
+        return float((self.consumers.house_idx >= 0).mean())
 
     def compute_houses_availability_rate(self) -> float:
         """
         Compute the houses availability rate.
-        Houses are available if their 'available' attribute is True.
+        Houses are available while their entry in the market's availability array is True.
         """
-        available_houses = sum(1 for house in self.housing_market.houses if house.available)
-        return available_houses / len(self.housing_market.houses)
+        return float(self.housing_market.house_available.mean())
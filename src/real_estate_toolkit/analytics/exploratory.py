@@ -2,8 +2,16 @@ import os
 import plotly.express as px
 import polars as pl
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
+
+
+def _pairwise_corr(a: str, b: str) -> pl.Expr:
+    """Pearson correlation of two columns over the rows where both are present."""
+    both_present = pl.col(a).is_not_null() & pl.col(b).is_not_null()
+    return pl.corr(pl.col(a).filter(both_present), pl.col(b).filter(both_present))
+
 
 class MarketAnalyzer:
     def __init__(self, data_path: str):
@@ -14,29 +22,76 @@ class MarketAnalyzer:
             data_path (str): Path to the Ames Housing dataset
         """
         self.data_path = data_path
-        # Read CSV as Polars DataFrame
-        self.real_state_data = pl.read_csv(str(self.data_path))
-        self.real_state_clean_data = None  # Will store a cleaned Pandas DataFrame after clean_data() is called.
+        # Scan CSV lazily; nothing is read until clean_data() collects the query
+        self.real_state_data = pl.scan_csv(str(self.data_path), null_values="NA", infer_schema_length=10000)
+        self.real_state_clean_data = None  # Will store a cleaned Polars DataFrame after clean_data() is called.
 
     def clean_data(self) -> None:
         """
         Perform comprehensive data cleaning.
 
         For now:
-        - Convert the Polars DataFrame to a Pandas DataFrame.
-        - Create a 'TotalSF' column if needed.
+        - Create a 'TotalSF' column.
+        - Collect the lazy query into a single Polars DataFrame.
         """
-        # Convert to Pandas
-        self.real_state_clean_data = self.real_state_data.to_pandas()
-
-        # If 'TotalSF' column is needed and doesn't exist, create it.
-        # Assuming TotalSF = GrLivArea + TotalBsmtSF (as an example)
-        if "GrLivArea" in self.real_state_clean_data.columns and "TotalBsmtSF" in self.real_state_clean_data.columns:
-            self.real_state_clean_data["TotalSF"] = self.real_state_clean_data["GrLivArea"] + self.real_state_clean_data["TotalBsmtSF"]
+        # TotalSF = GrLivArea + TotalBsmtSF, treating a missing basement area as 0
+        if "TotalBsmtSF" in self.real_state_data.collect_schema().names():
+            total_sf = pl.col("GrLivArea") + pl.col("TotalBsmtSF").fill_null(0)
         else:
-            # If TotalBsmtSF isn't available, just duplicate GrLivArea for demonstration
-            # Adjust this logic based on your actual dataset needs
-            self.real_state_clean_data["TotalSF"] = self.real_state_clean_data["GrLivArea"]
+            # If TotalBsmtSF isn't available, just duplicate GrLivArea
+            total_sf = pl.col("GrLivArea")
+
+        self.real_state_clean_data = self.real_state_data.with_columns(total_sf.alias("TotalSF")).collect()
+
+    def _plot_data(self, columns: List[str]) -> pd.DataFrame:
+        """
+        Build a Pandas DataFrame with only the given columns, for Plotly.
+
+        Columns go through NumPy, so the full dataset is never copied to Pandas.
+        """
+        return pd.DataFrame({column: self.real_state_clean_data[column].to_numpy() for column in columns})
+
+    def _add_ols_trendline(
+        self, fig: go.Figure, x: pd.Series, y: pd.Series, groups: Optional[pd.Series] = None
+    ) -> None:
+        """
+        Add ordinary least squares trendlines of y on x to a figure.
+
+        Without groups a single line is fitted over all points. With groups, one line is
+        fitted per group and drawn in the colour of that group's scatter trace, like
+        Plotly Express does for trendline="ols" with a discrete color column.
+        Each line is fitted with np.polyfit and drawn as its own trace.
+        """
+        x_values = x.to_numpy(dtype=float)
+        y_values = y.to_numpy(dtype=float)
+        valid = np.isfinite(x_values) & np.isfinite(y_values)
+        if groups is None:
+            self._add_ols_line(fig, x_values[valid], y_values[valid], name="OLS trendline")
+            return
+
+        group_values = groups.to_numpy()
+        trace_colors = {trace.name: trace.marker.color for trace in fig.data}
+        for group in pd.unique(group_values[valid]):
+            in_group = valid & (group_values == group)
+            self._add_ols_line(
+                fig, x_values[in_group], y_values[in_group],
+                name=str(group), color=trace_colors.get(str(group)), legendgroup=str(group), showlegend=False
+            )
+
+    @staticmethod
+    def _add_ols_line(fig: go.Figure, x_values: np.ndarray, y_values: np.ndarray, **trace_options: Any) -> None:
+        """
+        Fit y = slope * x + intercept and draw it across the range of x.
+        """
+        # A line needs at least two distinct x values
+        if np.unique(x_values).size < 2:
+            return
+        slope, intercept = np.polyfit(x_values, y_values, 1)
+        x_line = np.array([x_values.min(), x_values.max()])
+        color = trace_options.pop("color", None)
+        fig.add_trace(go.Scatter(
+            x=x_line, y=slope * x_line + intercept, mode="lines", line=dict(color=color), **trace_options
+        ))
 
     def generate_price_distribution_analysis(self) -> pl.DataFrame:
         """
@@ -52,22 +107,19 @@ class MarketAnalyzer:
         if self.real_state_clean_data is None:
             raise ValueError("Data not cleaned. Call clean_data() before analysis.")
 
-        # Compute statistics using Pandas
-        sale_price = self.real_state_clean_data["SalePrice"]
-        price_stats = {
-            "mean": sale_price.mean(),
-            "median": sale_price.median(),
-            "std": sale_price.std(),
-            "min": sale_price.min(),
-            "max": sale_price.max()
-        }
-
-        price_stats_df = pd.DataFrame([price_stats])
-        price_stats_pl = pl.from_pandas(price_stats_df)
+        # Compute all statistics in a single Polars select
+        sale_price = pl.col("SalePrice")
+        price_stats_pl = self.real_state_clean_data.select([
+            sale_price.mean().alias("mean"),
+            sale_price.median().alias("median"),
+            sale_price.std().alias("std"),
+            sale_price.min().alias("min"),
+            sale_price.max().alias("max")
+        ])
 
         # Create histogram with Plotly
         fig = px.histogram(
-            self.real_state_clean_data,
+            self._plot_data(["SalePrice"]),
             x="SalePrice",
             nbins=50,
             title="Sale Price Distribution",
@@ -78,7 +130,7 @@ class MarketAnalyzer:
         output_folder = "src/real_estate_toolkit/analytics/outputs/"
         os.makedirs(output_folder, exist_ok=True)
         plot_file = os.path.join(output_folder, "price_distribution.html")
-        fig.write_html(plot_file)
+        fig.write_html(plot_file, include_plotlyjs="cdn")
         print(f"Price distribution histogram saved to: {plot_file}")
 
         return price_stats_pl
@@ -96,34 +148,30 @@ class MarketAnalyzer:
         output_folder = "src/real_estate_toolkit/analytics/outputs/"
         os.makedirs(output_folder, exist_ok=True)
 
-        # Convert Pandas to Polars for computation
-        polars_data = pl.from_pandas(self.real_state_clean_data)
-
-        # Group by neighborhood
-        neighborhood_stats = polars_data.groupby("Neighborhood").agg([
+        # Group by neighborhood, keeping each group's prices for the boxplot
+        grouped = self.real_state_clean_data.group_by("Neighborhood", maintain_order=True).agg([
             pl.col("SalePrice").mean().alias("mean_price"),
             pl.col("SalePrice").median().alias("median_price"),
             pl.col("SalePrice").std().alias("std_dev_price"),
             pl.col("SalePrice").min().alias("min_price"),
-            pl.col("SalePrice").max().alias("max_price")
+            pl.col("SalePrice").max().alias("max_price"),
+            pl.col("SalePrice").alias("sale_prices")
         ])
+        neighborhood_stats = grouped.drop("sale_prices")
 
-        # Convert back to Pandas for Plotly
-        neighborhood_stats_pandas = neighborhood_stats.to_pandas()
-
-        # Create a boxplot for price comparison by neighborhood
-        fig = px.box(
-            self.real_state_clean_data,
-            x="Neighborhood",
-            y="SalePrice",
-            color="Neighborhood",
+        # Create a boxplot for price comparison by neighborhood, one trace per group
+        fig = go.Figure([
+            go.Box(y=prices, name=neighborhood, boxpoints="all")
+            for neighborhood, prices in zip(grouped["Neighborhood"].to_list(), grouped["sale_prices"].to_list())
+        ])
+        fig.update_layout(
             title="House Price Distribution by Neighborhood",
-            labels={"Neighborhood": "Neighborhood", "SalePrice": "Sale Price"},
-            points="all"
+            xaxis_title="Neighborhood",
+            yaxis_title="Sale Price"
         )
 
         plot_file = os.path.join(output_folder, "neighborhood_price_comparison.html")
-        fig.write_html(plot_file)
+        fig.write_html(plot_file, include_plotlyjs="cdn")
         print(f"Boxplot saved to: {plot_file}")
 
         return neighborhood_stats
@@ -135,17 +183,27 @@ class MarketAnalyzer:
         if self.real_state_clean_data is None:
             raise ValueError("Data not cleaned. Call clean_data() before analysis.")
 
-        df = self.real_state_clean_data
+        schema = self.real_state_clean_data.schema
         for var in variables:
-            if var not in df.columns:
+            if var not in schema:
                 raise ValueError(f"Variable {var} not found in the dataset.")
-            if not pd.api.types.is_numeric_dtype(df[var]):
+            if not schema[var].is_numeric():
                 raise ValueError(f"Variable {var} is not numeric.")
 
-        correlation_matrix = df[variables].corr()
+        # Pearson correlation of each pair over the rows where both variables are present,
+        # all pairs computed in a single Polars select
+        pairs = [(i, j) for i in range(len(variables)) for j in range(i, len(variables))]
+        pair_correlations = self.real_state_clean_data.select(
+            _pairwise_corr(variables[i], variables[j]).alias(f"{i}_{j}") for i, j in pairs
+        ).row(0)
+        correlation_matrix = np.empty((len(variables), len(variables)))
+        for (i, j), value in zip(pairs, pair_correlations):
+            correlation_matrix[i, j] = correlation_matrix[j, i] = np.nan if value is None else value
 
         fig = px.imshow(
             correlation_matrix,
+            x=variables,
+            y=variables,
             title="Correlation Heatmap",
             labels=dict(x="Variables", y="Variables", color="Correlation"),
             color_continuous_scale="RdBu_r",
@@ -156,7 +214,7 @@ class MarketAnalyzer:
         output_folder = "src/real_estate_toolkit/analytics/outputs/"
         os.makedirs(output_folder, exist_ok=True)
         output_path = os.path.join(output_folder, "correlation_heatmap.html")
-        fig.write_html(output_path)
+        fig.write_html(output_path, include_plotlyjs="cdn")
 
         print(f"Correlation heatmap saved to: {output_path}")
 
@@ -171,48 +229,49 @@ class MarketAnalyzer:
         os.makedirs(output_folder, exist_ok=True)
 
         scatter_plots = {}
+        plot_data = self._plot_data(["TotalSF", "SalePrice", "OverallQual", "YearBuilt", "Neighborhood"])
 
         # Scatter plot 1: House price vs. Total square footage
         fig1 = px.scatter(
-            self.real_state_clean_data,
+            plot_data,
             x="TotalSF",
             y="SalePrice",
             color="OverallQual",
             title="House Price vs. Total Square Footage",
             labels={"TotalSF": "Total Square Footage", "SalePrice": "Sale Price"},
-            hover_data=["YearBuilt", "Neighborhood"],
-            trendline="ols"
+            hover_data=["YearBuilt", "Neighborhood"]
         )
+        self._add_ols_trendline(fig1, plot_data["TotalSF"], plot_data["SalePrice"])
         scatter_plots["price_vs_sqft"] = fig1
-        fig1.write_html(os.path.join(output_folder, "scatter_price_vs_sqft.html"))
+        fig1.write_html(os.path.join(output_folder, "scatter_price_vs_sqft.html"), include_plotlyjs="cdn")
 
         # Scatter plot 2: Sale price vs. Year built
         fig2 = px.scatter(
-            self.real_state_clean_data,
+            plot_data,
             x="YearBuilt",
             y="SalePrice",
             color="Neighborhood",
             title="Sale Price vs. Year Built",
             labels={"YearBuilt": "Year Built", "SalePrice": "Sale Price"},
-            hover_data=["OverallQual", "TotalSF"],
-            trendline="ols"
+            hover_data=["OverallQual", "TotalSF"]
         )
+        self._add_ols_trendline(fig2, plot_data["YearBuilt"], plot_data["SalePrice"], plot_data["Neighborhood"])
         scatter_plots["price_vs_year"] = fig2
-        fig2.write_html(os.path.join(output_folder, "scatter_price_vs_year.html"))
+        fig2.write_html(os.path.join(output_folder, "scatter_price_vs_year.html"), include_plotlyjs="cdn")
 
         # Scatter plot 3: Overall quality vs. Sale price
         fig3 = px.scatter(
-            self.real_state_clean_data,
+            plot_data,
             x="OverallQual",
             y="SalePrice",
             color="Neighborhood",
             title="Overall Quality vs. Sale Price",
             labels={"OverallQual": "Overall Quality", "SalePrice": "Sale Price"},
-            hover_data=["TotalSF", "YearBuilt"],
-            trendline="ols"
+            hover_data=["TotalSF", "YearBuilt"]
         )
+        self._add_ols_trendline(fig3, plot_data["OverallQual"], plot_data["SalePrice"], plot_data["Neighborhood"])
         scatter_plots["quality_vs_price"] = fig3
-        fig3.write_html(os.path.join(output_folder, "scatter_quality_vs_price.html"))
+        fig3.write_html(os.path.join(output_folder, "scatter_quality_vs_price.html"), include_plotlyjs="cdn")
 
         print(f"Scatter plots saved to: {output_folder}")
 
@@ -1,7 +1,86 @@
 """Class for cleaning real estate data."""
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Any
-import re
+import polars as pl
+
+_UPPER = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_LOWER = frozenset('abcdefghijklmnopqrstuvwxyz')
+_LOWER_OR_DIGIT = _LOWER | frozenset('0123456789')
+
+_NA_VALUES = ['NA', 'N/A', 'NULL', '']
+
+# Placeholder for a key that is absent from a row
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _to_snake_case(column_name: str) -> str:
+    """
+    Convert a column name to snake_case in a single left-to-right pass.
+
+    A word starts at an uppercase letter that follows a lowercase letter or digit
+    (camelCase -> camel_case), or at the last capital of an acronym followed by a
+    lowercase letter (ABCTest -> abc_test). Every run of other characters, underscores
+    included, becomes one underscore, and leading/trailing ones are dropped.
+    """
+    chars: List[str] = []
+    last = len(column_name) - 1
+    for idx, char in enumerate(column_name):
+        if char in _UPPER:
+            previous = column_name[idx - 1] if idx > 0 else ''
+            following = column_name[idx + 1] if idx < last else ''
+            starts_word = previous in _LOWER_OR_DIGIT or (previous in _UPPER and following in _LOWER)
+            if starts_word and chars and chars[-1] != '_':
+                chars.append('_')
+            chars.append(char.lower())
+            continue
+        # Lowercase before checking, as str.lower() does on the whole name
+        for lowered in char.lower():
+            if lowered in _LOWER_OR_DIGIT:
+                chars.append(lowered)
+            elif chars and chars[-1] != '_':
+                chars.append('_')
+    if chars and chars[-1] == '_':
+        chars.pop()
+    return ''.join(chars)
+
+
+def _clean_column(values: List[Any]) -> List[Any]:
+    """
+    Clean one column of values: NA markers become None and values that parse as
+    numbers become floats. Anything else is kept as it is.
+    """
+    if set(map(type, values)) == {str}:
+        strings = pl.Series(values, dtype=pl.String)
+    else:
+        strings = pl.Series([value if isinstance(value, str) else None for value in values], dtype=pl.String)
+    is_na = strings.str.to_uppercase().is_in(_NA_VALUES).to_list()
+    numbers = strings.str.strip_chars().cast(pl.Float64, strict=False).to_list()
+    # Python's float() also accepts digit separators and non-ASCII digits, which Polars does not
+    python_only = strings.str.contains(r"[_]|[^\x00-\x7F]")
+
+    if strings.null_count() == 0 and not python_only.any():
+        # Only plain strings: Polars has already settled every cell
+        return [
+            None if na else value if number is None else number
+            for value, na, number in zip(values, is_na, numbers)
+        ]
+
+    cleaned = []
+    for value, na, number, retry in zip(values, is_na, numbers, python_only.to_list()):
+        if na:
+            value = None
+        elif number is not None:
+            value = number
+        elif value is not _MISSING and (retry or not isinstance(value, str)):
+            try:
+                value = float(value)
+            except ValueError:
+                pass
+        cleaned.append(value)
+    return cleaned
+
 
 @dataclass
 class Cleaner:
@@ -16,53 +95,41 @@ class Cleaner:
         if not self.data:
             return
 
-        column_mapping = {}
-        for column_name in self.data[0].keys():
-            cleaned_column_name = column_name
-            cleaned_column_name = re.sub(
-                r'([A-Z]+)([A-Z][a-z])',
-                lambda match: match.group(1).title() + match.group(2),
-                cleaned_column_name
-            )  # Step 2: Insert underscore between camelCase words
-            cleaned_column_name = re.sub(
-                r'([a-z0-9])([A-Z])',
-                r'\1_\2',
-                cleaned_column_name
-            )  # Step 3: Handle consecutive capitals (e.g., ABCTest -> abc_test)
-            cleaned_column_name = re.sub(
-                r'([A-Z])([A-Z][a-z])',
-                r'\1_\2',
-                cleaned_column_name
-            )  # Step 4: Convert to lowercase and replace remaining non-alphanumeric with underscore
-            cleaned_column_name = re.sub(
-                r'[^a-z0-9]+',
-                '_',
-                cleaned_column_name.lower()
-            )  # Step 5: Clean up multiple underscores and strip leading/trailing ones
-            cleaned_column_name = re.sub(r'_+', '_', cleaned_column_name).strip('_')
-            column_mapping[column_name] = cleaned_column_name
+        column_mapping = {
+            column_name: _to_snake_case(column_name) for column_name in self.data[0].keys()
+        }
         # Iterate over the rows in the data and rename the columns
         for row in self.data:
             for old_column, new_column in column_mapping.items():
                 row[new_column] = row.pop(old_column)
+
     def na_to_none(self) -> List[Dict[str, Any]]:
         """
         Replace 'NA' strings with None in all values.
+
+        Works column by column: the string cells of a column are checked for NA markers
+        and parsed as numbers in one Polars pass, while the decision is still taken per cell.
         
         Returns:
             List[Dict[str, Any]]: New list of dictionaries with NA replaced by None
         """
-        cleaned_data = []
-        for row in self.data:
-            cleaned_row = {}
-            for key, value in row.items():
-                # Check for various forms of NA
-                if isinstance(value, str) and value.upper() in ['NA', 'N/A', 'NULL', '']:
-                    cleaned_row[key] = None
-                else:
-                    try:
-                        cleaned_row[key] = float(value)
-                    except ValueError:
-                        cleaned_row[key] = value
-            cleaned_data.append(cleaned_row)
-        return cleaned_data
\ No newline at end of file
+        if not self.data:
+            return []
+        column_names = tuple(self.data[0])
+        if all(tuple(row) == column_names for row in self.data):
+            # Every row has the same keys in the same order: read the columns straight off the values
+            columns = [_clean_column(list(column)) for column in zip(*(row.values() for row in self.data))]
+            if not columns:
+                return [{} for _ in self.data]
+            return [dict(zip(column_names, values)) for values in zip(*columns)]
+
+        column_names = tuple(dict.fromkeys(key for row in self.data for key in row))
+        columns = [
+            _clean_column([row.get(column_name, _MISSING) for row in self.data])
+            for column_name in column_names
+        ]
+        # Keys a row did not have stay absent
+        return [
+            {key: value for key, value in zip(column_names, values) if value is not _MISSING}
+            for values in zip(*columns)
+        ]
@@ -1,108 +1,216 @@
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Any, Union
+from dataclasses import dataclass, field, InitVar
+from typing import Dict, List, Optional, Tuple, Any, Union
+import warnings
 import numpy as np
 import pandas as pd
+import polars as pl
+
+# Largest value for which an integer column is counted with np.bincount
+_BINCOUNT_LIMIT = 10**6
+
+
+def _mode(values: np.ndarray) -> Any:
+    """Most frequent value of a non-empty array without missing values; ties go to the smallest value."""
+    if np.issubdtype(values.dtype, np.integer) and values.min() >= 0 and values.max() < _BINCOUNT_LIMIT:
+        return values.dtype.type(np.bincount(values).argmax())
+    if np.issubdtype(values.dtype, np.number):
+        # NumPy's sort is faster than hashing for floats
+        unique, counts = np.unique(values, return_counts=True)
+        return unique[np.argmax(counts)]
+    # Hash-based counting instead of sorting Python objects
+    counts = pd.Series(values).value_counts(sort=False)
+    top = counts[counts == counts.max()].index
+    try:
+        return min(top)
+    except TypeError:
+        # Values that cannot be ordered against each other
+        return top[0]
+
+
+def _quantile(values: np.ndarray, q: float) -> float:
+    """q-th percentile of a NaN-free array, interpolated like np.percentile but selected with np.partition."""
+    if np.ndim(q):
+        # Several percentiles at once: one np.percentile call shares the work
+        return np.percentile(values, q) if values.size else np.full(np.shape(q), np.nan)
+    if values.size == 0:
+        return np.nan
+    if not 0 <= q <= 100:
+        raise ValueError("Percentiles must be in the range [0, 100]")
+    position = q / 100 * (values.size - 1)
+    lower = int(position)
+    # Select a single element; its right neighbour is the minimum of the larger side.
+    # This is much faster than asking np.partition for two positions at once.
+    selected = np.partition(values, lower)
+    low = selected[lower]
+    if lower + 1 == values.size:
+        return low
+    high = selected[lower + 1:].min()
+    # Same two-sided interpolation as np.percentile, so results agree to the last bit
+    fraction = position - lower
+    if fraction >= 0.5:
+        return high - (high - low) * (1 - fraction)
+    return low + (high - low) * fraction
+
+
+def _median(values: np.ndarray) -> float:
+    """Median of a non-empty NaN-free array, averaging the two middle values like np.nanmedian."""
+    middle = values.size // 2
+    if values.size % 2:
+        return np.partition(values, middle)[middle]
+    selected = np.partition(values, middle - 1)
+    return np.mean([selected[middle - 1], selected[middle:].min()])
+
+
+def _drop_missing(values: np.ndarray) -> np.ndarray:
+    """Values of a column without its missing entries, tested in the cheapest way for its dtype."""
+    if np.issubdtype(values.dtype, np.integer) or values.dtype == bool:
+        return values
+    if np.issubdtype(values.dtype, np.inexact):
+        return values[~np.isnan(values)]
+    return values[~pd.isna(values)]
+
+
+def _nan_stats(values: np.ndarray) -> Tuple[np.ndarray, float, float]:
+    """Drop NaN from a float column once and return the remaining values with their mean and median."""
+    clean = values[~np.isnan(values)]
+    if clean.size == 0:
+        return clean, np.nan, np.nan
+    # np.nanmean on the full column keeps the summation order, and so the result, of the original
+    return clean, np.nanmean(values), _median(clean)
+
 
 @dataclass
 class Descriptor:
     """Class for computing descriptive statistics on real estate data using Python and pandas."""
-    data: List[Dict[str, Any]]
-
-    def _to_dataframe(self) -> pd.DataFrame:
-        """Convert the list of dicts to a pandas DataFrame."""
-        return pd.DataFrame(self.data)
+    data: Union[List[Dict[str, Any]], pl.DataFrame]
+    _df: pd.DataFrame = field(init=False, repr=False, compare=False)
+    _numeric_df: pd.DataFrame = field(init=False, repr=False, compare=False)
+    _all_cols: List[str] = field(init=False, repr=False, compare=False)
+    _numeric_cols: List[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Build the DataFrame and its numeric view once, instead of on every statistic."""
+        if isinstance(self.data, pl.DataFrame):
+            # Columnar input: hand each typed column over as a NumPy array
+            self._df = pd.DataFrame({col: self.data[col].to_numpy() for col in self.data.columns})
+            # Columns are already typed, so there is nothing to parse; text columns have no numeric values
+            self._numeric_df = self._df.select_dtypes(include=[np.number]).reindex(columns=self._df.columns)
+        else:
+            self._df = pd.DataFrame(self.data)
+            self._numeric_df = self._df.apply(pd.to_numeric, errors='coerce')
+        # Column lists used when columns="all"
+        self._all_cols = self._df.columns.tolist()
+        self._numeric_cols = self._df.select_dtypes(include=[np.number]).columns.tolist()
 
     def none_ratio(self, columns: List[str] = "all") -> Dict[str, float]:
-        df = self._to_dataframe()
         if columns == "all":
-            columns = df.columns.tolist()
+            columns = self._all_cols
+        self._validate_columns(columns)
 
-        none_ratios = {}
-        for col in columns:
-            if col not in df.columns:
-                raise ValueError(f"Invalid column name: {col}")
-            col_data = df[col]
-            ratio = col_data.isna().mean()
-            none_ratios[col] = ratio
-        return none_ratios
+        ratios = self._df[columns].isna().mean(axis=0)
+        return dict(zip(columns, ratios.to_numpy()))
 
     def average(self, columns: List[str] = "all") -> Dict[str, float]:
-        df = self._to_dataframe()
         # If columns = "all", select all numeric columns
         if columns == "all":
-            columns = df.select_dtypes(include=[np.number]).columns.tolist()
+            columns = self._numeric_cols
+        self._validate_columns(columns)
 
-        averages = {}
-        for col in columns:
-            if col not in df.columns:
-                raise ValueError(f"Invalid column name: {col}")
-            col_data = pd.to_numeric(df[col], errors='coerce')
-            avg = col_data.mean(skipna=True)
-            averages[col] = avg
-        return averages
+        averages = self._numeric_df[columns].mean(axis=0, skipna=True)
+        return dict(zip(columns, averages.to_numpy()))
 
     def median(self, columns: List[str] = "all") -> Dict[str, float]:
-        df = self._to_dataframe()
         if columns == "all":
-            columns = df.select_dtypes(include=[np.number]).columns.tolist()
+            columns = self._numeric_cols
+        self._validate_columns(columns)
 
-        medians = {}
-        for col in columns:
-            if col not in df.columns:
-                raise ValueError(f"Invalid column name: {col}")
-            col_data = pd.to_numeric(df[col], errors='coerce')
-            med = col_data.median(skipna=True)
-            medians[col] = med
-        return medians
-
-    def percentile(self, columns: List[str] = "all", percentile: int = 50) -> Dict[str, float]:
-        df = self._to_dataframe()
-        if columns == "all":
-            columns = df.select_dtypes(include=[np.number]).columns.tolist()
+        medians = self._numeric_df[columns].median(axis=0, skipna=True)
+        return dict(zip(columns, medians.to_numpy()))
 
-        percentiles = {}
-        for col in columns:
-            if col not in df.columns:
-                raise ValueError(f"Invalid column name: {col}")
-            col_data = pd.to_numeric(df[col], errors='coerce').dropna()
-            if col_data.empty:
-                val = np.nan
-            else:
-                val = np.percentile(col_data, percentile)
-            percentiles[col] = val
-        return percentiles
+    def percentile(
+        self, columns: List[str] = "all", percentile: Union[int, List[int]] = 50
+    ) -> Dict[str, Union[float, np.ndarray]]:
+        """Percentile of each column; a list of percentiles gives one array per column, in the same order."""
+        if columns == "all":
+            columns = self._numeric_cols
+        self._validate_columns(columns)
+        if not columns:
+            return {}
+
+        arr = self._numeric_df[columns].to_numpy(dtype=np.float64)
+        with warnings.catch_warnings():
+            # Columns without any numeric value give NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            # Every column and every percentile in a single call
+            percentiles = np.nanpercentile(arr, percentile, axis=0)
+        # With several percentiles the result has one row per percentile
+        return dict(zip(columns, percentiles.T if np.ndim(percentile) else percentiles))
 
     def type_and_mode(self, columns: List[str] = "all") -> Dict[str, Union[Tuple[str, float], Tuple[str, str]]]:
-        df = self._to_dataframe()
+        df = self._df
         if columns == "all":
-            columns = df.columns.tolist()
+            columns = self._all_cols
+        self._validate_columns(columns)
 
         type_modes = {}
-        for col in columns:
-            if col not in df.columns:
-                raise ValueError(f"Invalid column name: {col}")
-
-            col_data = df[col].dropna()
+        # Each column on its own: a frame-wide mode pads columns with NaN and upcasts them to float
+        for col in dict.fromkeys(columns):
+            col_data = df[col]
+            modes = col_data.mode(dropna=True)
 
             # Determine type
             if pd.api.types.is_numeric_dtype(col_data):
                 col_type = "numeric"
-                mode_val = col_data.mode()
-                mode_val = mode_val.iloc[0] if not mode_val.empty else np.nan
+                mode_val = modes.iloc[0] if not modes.empty else np.nan
             else:
                 col_type = "categorical"
-                mode_val = col_data.mode()
-                mode_val = mode_val.iloc[0] if not mode_val.empty else None
+                mode_val = modes.iloc[0] if not modes.empty else None
 
             type_modes[col] = (col_type, mode_val)
         return type_modes
 
+    def _validate_columns(self, columns: List[str]):
+        invalid_columns = [col for col in columns if col not in self._df.columns]
+        if invalid_columns:
+            raise ValueError(f"Invalid column names: {invalid_columns}")
+
 
 @dataclass
 class DescriptorNumpy:
     """Class for computing descriptive statistics on real estate data using NumPy."""
-    data: np.ndarray
+    data: Optional[np.ndarray]
     column_names: List[str]
+    columns: InitVar[Optional[Dict[str, np.ndarray]]] = None
+    _cols: Dict[str, np.ndarray] = field(init=False, repr=False)
+    _stats: Dict[str, Tuple[np.ndarray, float, float]] = field(init=False, repr=False)
+    _numeric_names: List[str] = field(init=False, repr=False)
+
+    def __post_init__(self, columns: Optional[Dict[str, np.ndarray]]):
+        """Store one contiguous 1-D array per column, so statistics never slice or recast the 2-D array."""
+        if columns is None:
+            # One transposed copy turns every column into a contiguous row
+            rows = np.ascontiguousarray(self.data.T)
+            columns = {name: rows[idx] for idx, name in reversed(list(enumerate(self.column_names)))}
+        self._cols = columns
+        self._stats = {}
+        self._numeric_names = [
+            col for col in self.column_names if np.issubdtype(self._cols[col].dtype, np.number)
+        ]
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Any]) -> "DescriptorNumpy":
+        """Build a descriptor from one 1-D array per column, each cast to its natural dtype."""
+        typed = {}
+        for name, values in columns.items():
+            col_data = np.asarray(values)
+            if col_data.dtype == object:
+                # Numbers mixed with None become float64 with NaN; anything else stays categorical
+                try:
+                    col_data = col_data.astype(np.float64)
+                except (TypeError, ValueError):
+                    pass
+            typed[name] = col_data
+        return cls(None, list(typed), typed)
 
     def none_ratio(self, columns: List[str] = "all") -> Dict[str, float]:
         if columns == "all":
@@ -111,9 +219,15 @@ class DescriptorNumpy:
 
         none_ratios = {}
         for col in columns:
-            col_idx = self.column_names.index(col)
-            col_data = self.data[:, col_idx]
-            none_ratios[col] = np.mean(pd.isna(col_data))
+            col_data = self._cols[col]
+            if np.issubdtype(col_data.dtype, np.integer) or col_data.dtype == bool:
+                # Integer and boolean arrays cannot hold missing values
+                missing = 0
+            elif np.issubdtype(col_data.dtype, np.inexact):
+                missing = np.count_nonzero(np.isnan(col_data))
+            else:
+                missing = np.count_nonzero(pd.isna(col_data))
+            none_ratios[col] = np.float64(missing) / col_data.size
         return none_ratios
 
     def average(self, columns: List[str] = "all") -> Dict[str, float]:
@@ -121,35 +235,25 @@ class DescriptorNumpy:
             columns = self._numeric_columns()
         self._validate_columns(columns)
 
-        averages = {}
-        for col in columns:
-            col_idx = self.column_names.index(col)
-            col_data = self.data[:, col_idx].astype(float)
-            averages[col] = np.nanmean(col_data)
-        return averages
+        return {col: self._column_stats(col)[1] for col in columns}
 
     def median(self, columns: List[str] = "all") -> Dict[str, float]:
         if columns == "all":
             columns = self._numeric_columns()
         self._validate_columns(columns)
 
-        medians = {}
-        for col in columns:
-            col_idx = self.column_names.index(col)
-            col_data = self.data[:, col_idx].astype(float)
-            medians[col] = np.nanmedian(col_data)
-        return medians
+        return {col: self._column_stats(col)[2] for col in columns}
 
-    def percentile(self, columns: List[str] = "all", percentile: int = 50) -> Dict[str, float]:
+    def percentile(
+        self, columns: List[str] = "all", percentile: Union[int, List[int]] = 50
+    ) -> Dict[str, Union[float, np.ndarray]]:
         if columns == "all":
             columns = self._numeric_columns()
         self._validate_columns(columns)
 
         percentiles = {}
         for col in columns:
-            col_idx = self.column_names.index(col)
-            col_data = self.data[:, col_idx].astype(float)
-            percentiles[col] = np.nanpercentile(col_data, percentile)
+            percentiles[col] = _quantile(self._column_stats(col)[0], percentile)
         return percentiles
 
     def type_and_mode(self, columns: List[str] = "all") -> Dict[str, Union[Tuple[str, float], Tuple[str, str]]]:
@@ -159,41 +263,33 @@ class DescriptorNumpy:
 
         type_modes = {}
         for col in columns:
-            col_idx = self.column_names.index(col)
-            col_data = self.data[:, col_idx]
-
-            col_type = "numeric" if np.issubdtype(col_data.dtype, np.number) else "categorical"
-
-            if col_type == "numeric":
-                # Compute mode for numeric columns
-                # If all NaN, mode should be NaN
-                clean_data = col_data[~pd.isna(col_data)]
-                if len(clean_data) == 0:
-                    mode = np.nan
-                else:
-                    vals, counts = np.unique(clean_data, return_counts=True)
-                    mode = vals[np.argmax(counts)]
+            col_data = self._cols[col]
+
+            is_numeric = np.issubdtype(col_data.dtype, np.number)
+            col_type = "numeric" if is_numeric else "categorical"
+
+            clean_data = _drop_missing(col_data)
+            if len(clean_data) == 0:
+                # A column with only missing values has no mode
+                mode = np.nan if is_numeric else None
             else:
-                # Compute mode for categorical columns
-                clean_data = col_data[~pd.isna(col_data)]
-                if len(clean_data) == 0:
-                    mode = None
-                else:
-                    unique, counts = np.unique(clean_data, return_counts=True)
-                    mode = unique[np.argmax(counts)]
+                mode = _mode(clean_data)
 
             type_modes[col] = (col_type, mode)
         return type_modes
 
     def _validate_columns(self, columns: List[str]):
-        invalid_columns = [col for col in columns if col not in self.column_names]
+        invalid_columns = [col for col in columns if col not in self._cols]
         if invalid_columns:
             raise ValueError(f"Invalid column names: {invalid_columns}")
 
     def _numeric_columns(self) -> List[str]:
-        numeric_columns = []
-        for col in self.column_names:
-            col_idx = self.column_names.index(col)
-            if np.issubdtype(self.data[:, col_idx].dtype, np.number):
-                numeric_columns.append(col)
-        return numeric_columns
+        return self._numeric_names
+
+    def _column_stats(self, col: str) -> Tuple[np.ndarray, float, float]:
+        """NaN-free values, mean and median of a column, computed together the first time any is needed."""
+        stats = self._stats.get(col)
+        if stats is None:
+            stats = _nan_stats(self._cols[col].astype(np.float64, copy=False))
+            self._stats[col] = stats
+        return stats
@@ -1,13 +1,59 @@
 """Module for loading and basic processing of real estate data."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, FrozenSet, Optional, Tuple
 import csv
+import polars as pl
+
+# Numeric column types of the Kaggle House Prices data. Columns with missing values
+# in train.csv or test.csv are Float32 so they stay floats with NaN outside Polars.
+HOUSE_PRICES_SCHEMA: Dict[str, pl.DataType] = {
+    "Id": pl.Int32,
+    "MSSubClass": pl.Int32,
+    "LotFrontage": pl.Float32,
+    "LotArea": pl.Int32,
+    "OverallQual": pl.Int32,
+    "OverallCond": pl.Int32,
+    "YearBuilt": pl.Int32,
+    "YearRemodAdd": pl.Int32,
+    "MasVnrArea": pl.Float32,
+    "BsmtFinSF1": pl.Float32,
+    "BsmtFinSF2": pl.Float32,
+    "BsmtUnfSF": pl.Float32,
+    "TotalBsmtSF": pl.Float32,
+    "1stFlrSF": pl.Int32,
+    "2ndFlrSF": pl.Int32,
+    "LowQualFinSF": pl.Int32,
+    "GrLivArea": pl.Int32,
+    "BsmtFullBath": pl.Float32,
+    "BsmtHalfBath": pl.Float32,
+    "FullBath": pl.Int32,
+    "HalfBath": pl.Int32,
+    "BedroomAbvGr": pl.Int32,
+    "KitchenAbvGr": pl.Int32,
+    "TotRmsAbvGrd": pl.Int32,
+    "Fireplaces": pl.Int32,
+    "GarageYrBlt": pl.Float32,
+    "GarageCars": pl.Float32,
+    "GarageArea": pl.Float32,
+    "WoodDeckSF": pl.Int32,
+    "OpenPorchSF": pl.Int32,
+    "EnclosedPorch": pl.Int32,
+    "3SsnPorch": pl.Int32,
+    "ScreenPorch": pl.Int32,
+    "PoolArea": pl.Int32,
+    "MiscVal": pl.Int32,
+    "MoSold": pl.Int32,
+    "YrSold": pl.Int32,
+    "SalePrice": pl.Int32,
+}
 
 @dataclass
 class DataLoader:
     """Class for loading and basic processing of real estate data."""
     data_path: Path = Path("/Users/tomowen/Desktop/real_estate_toolkit/files/train.csv")
+    # Header of the file last validated, as (data_path, column names)
+    _header: Optional[Tuple[Path, FrozenSet[str]]] = field(default=None, init=False, repr=False, compare=False)
 
     def load_data_from_csv(self) -> List[Dict[str, Any]]:
         """
@@ -23,17 +69,54 @@ class DataLoader:
         if not self.data_path.exists():
             raise FileNotFoundError(f"File not found: {self.data_path}")
         try:
-            data: List[Dict[str, Any]] = []
             with open(self.data_path, 'r', encoding='utf-8') as csv_file:
-                csv_reader = csv.DictReader(csv_file)
-                for row in csv_reader:
-                    data.append(dict(row))
+                # DictReader already yields a fresh dict per row, so no copy is needed
+                data: List[Dict[str, Any]] = list(csv.DictReader(csv_file))
             if not data:
                 raise ValueError("CSV file is empty")
             return data
         except csv.Error as e:
             raise csv.Error(f"Error reading CSV file: {e}")
 
+    def load_data_columnar(self) -> pl.DataFrame:
+        """
+        Load data from CSV file into a typed, column-oriented Polars DataFrame.
+        
+        Returns:
+            pl.DataFrame: One typed column per CSV field, with "NA" read as null
+        
+        Raises:
+            FileNotFoundError: If the specified file doesn't exist
+            ValueError: If the CSV file is empty
+        """
+        if not self.data_path.exists():
+            raise FileNotFoundError(f"File not found: {self.data_path}")
+        data = pl.read_csv(self.data_path, null_values="NA", infer_schema_length=10000)
+        if data.is_empty():
+            raise ValueError("CSV file is empty")
+        return data
+
+    def load_typed(self, schema: Dict[str, pl.DataType] = HOUSE_PRICES_SCHEMA) -> pl.DataFrame:
+        """
+        Load data from CSV file with declared column types instead of inferred ones.
+        
+        Args:
+            schema: Column types to use; columns not listed are read as text
+        
+        Returns:
+            pl.DataFrame: One column per CSV field, with "NA" read as null
+        
+        Raises:
+            FileNotFoundError: If the specified file doesn't exist
+            ValueError: If the CSV file is empty
+        """
+        if not self.data_path.exists():
+            raise FileNotFoundError(f"File not found: {self.data_path}")
+        data = pl.read_csv(self.data_path, null_values="NA", infer_schema=False, schema_overrides=schema)
+        if data.is_empty():
+            raise ValueError("CSV file is empty")
+        return data
+
     def validate_columns(self, required_columns: List[str]) -> bool:
         """
         Validate that all required columns are present in the dataset.
@@ -49,11 +132,12 @@ class DataLoader:
             csv.Error: If the CSV file is empty or malformed
         """
         try:
-            # Load just the header row to check columns
-            with open(self.data_path, 'r', encoding='utf-8') as csv_file:
-                csv_reader = csv.reader(csv_file)
-                csv_header = next(csv_reader)
+            # Load just the header row once per file and keep it for later checks
+            if self._header is None or self._header[0] != self.data_path:
+                with open(self.data_path, 'r', encoding='utf-8') as csv_file:
+                    csv_reader = csv.reader(csv_file)
+                    self._header = (self.data_path, frozenset(next(csv_reader)))
             # Check if all required columns are in header
-            return all(col in csv_header for col in required_columns)
+            return not set(required_columns) - self._header[1]
         except (FileNotFoundError, csv.Error):
             return False
\ No newline at end of file
@@ -1,19 +1,18 @@
 from typing import List, Dict, Any
 import os
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler, OneHotEncoder
+from sklearn.preprocessing import StandardScaler, OneHotEncoder, OrdinalEncoder
 from sklearn.impute import SimpleImputer
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor, HistGradientBoostingRegressor
 from sklearn.metrics import (
     mean_squared_error,
     mean_absolute_error,
     r2_score,
     mean_absolute_percentage_error,
 )
-import polars as pl
 import pandas as pd
 import numpy as np
 
@@ -23,9 +22,11 @@ class HousePricePredictor:
         """
         Initialize the predictor class with paths to the training and testing datasets.
         """
-        self.train_data = pl.read_csv(str(train_data_path))
-        self.test_data = pl.read_csv(str(test_data_path))
+        self.train_data = pd.read_csv(train_data_path)
+        self.test_data = pd.read_csv(test_data_path)
         self.models = {}  # Store trained models here
+        self.preprocessor = None
+        self.X_forecast = None  # Preprocessed test features, filled on first forecast
 
 
     def prepare_features(
@@ -34,7 +35,7 @@ class HousePricePredictor:
         """
         Prepare the dataset for machine learning.
         """
-        df = self.train_data.to_pandas()  # Convert to pandas for compatibility with sklearn
+        df = self.train_data
         X = df.drop(columns=[target_column]) if selected_predictors is None else df[selected_predictors]
         y = df[target_column]
 
@@ -49,7 +50,7 @@ class HousePricePredictor:
         ])
         categorical_transformer = Pipeline(steps=[
             ("imputer", SimpleImputer(strategy="constant", fill_value="missing")),
-            ("onehot", OneHotEncoder(handle_unknown="ignore"))
+            ("onehot", OneHotEncoder(handle_unknown="ignore", sparse_output=True))
         ])
 
 
@@ -66,6 +67,11 @@ class HousePricePredictor:
 
         self.X_train = preprocessor.fit_transform(X_train)
         self.X_test = preprocessor.transform(X_test)
+        self.preprocessor = preprocessor
+        # Raw feature frames, for models that bring their own preprocessing
+        self.features_train, self.features_test = X_train, X_test
+        self.numeric_features, self.categorical_features = numeric_features, categorical_features
+        self.X_forecast = None
         self.y_train, self.y_test = y_train, y_test
 
 
@@ -76,32 +82,58 @@ class HousePricePredictor:
         results = {}
 
 
+        # Categories become integer codes the booster splits on natively, instead of one-hot columns
+        ordinal_preprocessor = ColumnTransformer(
+            transformers=[
+                ("num", "passthrough", self.numeric_features),
+                ("cat", OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=-1), self.categorical_features)
+            ]
+        )
+        categorical_mask = [False] * len(self.numeric_features) + [True] * len(self.categorical_features)
+
+
         models = {
             "Linear Regression": LinearRegression(),
-            "Random Forest Regressor": RandomForestRegressor(random_state=42)
+            "Random Forest Regressor": RandomForestRegressor(random_state=42, n_jobs=-1, oob_score=True),
+            "Histogram Gradient Boosting Regressor": Pipeline(steps=[
+                ("preprocessor", ordinal_preprocessor),
+                ("model", HistGradientBoostingRegressor(categorical_features=categorical_mask, random_state=42))
+            ])
         }
 
 
         for name, model in models.items():
-            model.fit(self.X_train, self.y_train)
+            # Pipelines preprocess the raw features themselves
+            if isinstance(model, Pipeline):
+                X_train, X_test = self.features_train, self.features_test
+            else:
+                X_train, X_test = self.X_train, self.X_test
+            model.fit(X_train, self.y_train)
             self.models[name] = model
 
 
-            train_preds = model.predict(self.X_train)
-            test_preds = model.predict(self.X_test)
-
-
-            results[name] = {
-                "metrics": {
+            test_preds = model.predict(X_test)
+            metrics = {
+                "Test MSE": mean_squared_error(self.y_test, test_preds),
+                "Test R2": r2_score(self.y_test, test_preds),
+                "Test MAE": mean_absolute_error(self.y_test, test_preds),
+                "Test MAPE": mean_absolute_percentage_error(self.y_test, test_preds),
+            }
+            if hasattr(model, "oob_score_"):
+                # Out-of-bag R2 measures the fit on the training set without another pass over the forest
+                metrics["OOB R2"] = model.oob_score_
+            else:
+                train_preds = model.predict(X_train)
+                metrics.update({
                     "Train MSE": mean_squared_error(self.y_train, train_preds),
-                    "Test MSE": mean_squared_error(self.y_test, test_preds),
                     "Train R2": r2_score(self.y_train, train_preds),
-                    "Test R2": r2_score(self.y_test, test_preds),
                     "Train MAE": mean_absolute_error(self.y_train, train_preds),
-                    "Test MAE": mean_absolute_error(self.y_test, test_preds),
                     "Train MAPE": mean_absolute_percentage_error(self.y_train, train_preds),
-                    "Test MAPE": mean_absolute_percentage_error(self.y_test, test_preds),
-                },
+                })
+
+
+            results[name] = {
+                "metrics": metrics,
                 "model": model
             }
 
@@ -117,10 +149,15 @@ class HousePricePredictor:
             raise ValueError(f"Model {model_type} is not trained.")
 
 
-        test_df = self.test_data.to_pandas()
-        test_features = test_df.drop(columns=["Id"])
-        preprocessed_features = self.X_train.transform(test_features)
-        predictions = self.models[model_type].predict(preprocessed_features)
+        test_df = self.test_data
+        test_features = test_df[self.preprocessor.feature_names_in_]
+        model = self.models[model_type]
+        if isinstance(model, Pipeline):
+            predictions = model.predict(test_features)
+        else:
+            if self.X_forecast is None:
+                self.X_forecast = self.preprocessor.transform(test_features)
+            predictions = model.predict(self.X_forecast)
 
 
         submission = pd.DataFrame({"Id": test_df["Id"], "SalePrice": predictions})